@@ -0,0 +1,58 @@
+"""Optional Numba-accelerated summarization of latency samples.
+
+Falls back to numpy when numba is not installed; the JIT path fuses
+min/max/mean/stddev into a single pass over the sample array, which pays
+off once runs collect a large number of samples.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - depends on optional extra
+    HAS_NUMBA = False
+
+# Below this sample count the numpy passes are cheap enough that the JIT
+# call (and its first-use compilation) isn't worth it.
+_JIT_THRESHOLD = 10_000
+
+if HAS_NUMBA:
+
+    @njit(cache=True, nogil=True)  # type: ignore[untyped-decorator]
+    def _summarize_jit(arr: np.ndarray) -> Tuple[float, float, float, float]:
+        minimum = arr[0]
+        maximum = arr[0]
+        total = 0.0
+        total_sq = 0.0
+        for value in arr:
+            if value < minimum:
+                minimum = value
+            if value > maximum:
+                maximum = value
+            # Square in float: int64 nanoseconds overflow when squared
+            # for any sample longer than ~3 seconds
+            v = float(value)
+            total += v
+            total_sq += v * v
+        mean = total / arr.size
+        variance = total_sq / arr.size - mean * mean
+        if variance < 0.0:
+            variance = 0.0
+        return float(minimum), float(maximum), mean, variance**0.5
+
+
+def summarize(arr: np.ndarray) -> Tuple[float, float, float, float]:
+    """Return (min, max, mean, stddev) of a non-empty sample array."""
+    if HAS_NUMBA and arr.size > _JIT_THRESHOLD:
+        return _summarize_jit(arr)  # type: ignore[no-any-return]
+
+    return (
+        float(arr.min()),
+        float(arr.max()),
+        float(arr.mean()),
+        float(arr.std()),
+    )
@@ -1,14 +1,18 @@
 """CLI interface for MCP scale testing."""
 
 import asyncio
+import json
+import logging
 import sys
+import traceback
 from pathlib import Path
 from typing import Optional
 
 import click
+import yaml
 
 from . import __version__
-from .config import load_config, save_results
+from .config import SafeDumper, load_config, save_results
 from .load_test import run_load_test
 
 
@@ -26,9 +30,19 @@ from .load_test import run_load_test
     type=click.Path(path_type=Path),
     help="Path to save results YAML file (default: print to stdout)",
 )
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(["yaml", "json"]),
+    default="yaml",
+    help="Output format for results printed to stdout",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
 @click.version_option(version=__version__)
-def main(config: Path, output: Optional[Path], verbose: bool) -> None:
+def main(
+    config: Path, output: Optional[Path], output_format: str, verbose: bool
+) -> None:
     """
     MCP Scale Test - CLI tool for testing MCP server scalability.
 
@@ -36,6 +50,10 @@ def main(config: Path, output: Optional[Path], verbose: bool) -> None:
     connection details and test parameters, then runs a concurrent load
     test against the server and outputs performance statistics.
     """
+    # Client modules log connection details at DEBUG; surface them only
+    # with --verbose so worker startup doesn't serialize through stdout
+    logging.basicConfig(level=logging.DEBUG if verbose else logging.WARNING)
+
     try:
         # Load configuration
         if verbose:
@@ -51,14 +69,23 @@ def main(config: Path, output: Optional[Path], verbose: bool) -> None:
             click.echo(f"Concurrent requests: {test_config.test.concurrent_requests}")
             click.echo(f"Duration: {test_config.test.duration_seconds}s")
 
+        # Use uvloop when installed; the libuv-backed loop gives notably
+        # higher task throughput than the default selector loop
+        try:
+            import uvloop
+
+            uvloop.install()
+        except ImportError:
+            pass
+
         # Run the load test
         results = asyncio.run(run_load_test(test_config))
 
         # Add metadata to results
         full_results = {
             "test_config": {
-                "server": test_config.server.dict(),
-                "test": test_config.test.dict(),
+                "server": test_config.server.model_dump(mode="json"),
+                "test": test_config.test.model_dump(mode="json"),
             },
             "results": results,
         }
@@ -68,10 +95,17 @@ def main(config: Path, output: Optional[Path], verbose: bool) -> None:
             save_results(full_results, str(output))
             if verbose:
                 click.echo(f"Results saved to {output}")
+        elif output_format == "json":
+            click.echo(json.dumps(full_results, indent=2))
         else:
-            import yaml
-
-            click.echo(yaml.dump(full_results, default_flow_style=False, indent=2))
+            click.echo(
+                yaml.dump(
+                    full_results,
+                    Dumper=SafeDumper,
+                    default_flow_style=False,
+                    indent=2,
+                )
+            )
 
     except FileNotFoundError as e:
         click.echo(f"Error: Configuration file not found: {e}", err=True)
@@ -80,8 +114,6 @@ def main(config: Path, output: Optional[Path], verbose: bool) -> None:
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
         if verbose:
-            import traceback
-
             traceback.print_exc()
         sys.exit(1)
 
@@ -1,10 +1,12 @@
 """MCP client implementations using the official MCP library."""
 
 import asyncio
+import logging
 from abc import ABC, abstractmethod
 from datetime import timedelta
 from typing import Any, Dict, List, Optional
 
+import httpx
 from mcp import ClientSession
 from mcp.client.sse import sse_client
 from mcp.client.streamable_http import streamablehttp_client
@@ -12,12 +14,82 @@ from mcp.types import Tool
 
 from .config import ServerConfig
 
+logger = logging.getLogger(__name__)
+
+
+def _http_url(config: ServerConfig) -> str:
+    """Build the HTTP endpoint URL for a server configuration."""
+    port_part = f":{config.port}" if config.port else ""
+    path_part = config.path or ""
+    return f"http://{config.host}{port_part}{path_part}"
+
+
+class _PooledTransport(httpx.AsyncHTTPTransport):
+    """Transport whose lifetime is owned by the pool, not by any client.
+
+    httpx clients close their transport on aclose(); with many MCP sessions
+    sharing one transport, the first session to close would tear down the
+    pool for everyone, so per-client closes are ignored.
+    """
+
+    async def aclose(self) -> None:
+        pass
+
+    async def aclose_pool(self) -> None:
+        await super().aclose()
+
+
+class HttpConnectionPool:
+    """Shared TCP connection pool for the HTTP-based MCP transports.
+
+    Every MCP session normally builds its own httpx client with a private
+    connection pool; routing the clients of concurrently running sessions
+    through one shared transport caps the total socket count and lets
+    keep-alive connections be reused.
+
+    Only long-lived sessions (shared-session mode) may use the pool. The
+    transport ignores per-client aclose(), so a closed session cannot
+    force-close its streams; short-lived per-request sessions would leak
+    connections into the pool until max_connections starves new connects.
+    """
+
+    def __init__(self, max_connections: int):
+        self._transport = _PooledTransport(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            )
+        )
+
+    def client_factory(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[httpx.Timeout] = None,
+        auth: Optional[httpx.Auth] = None,
+    ) -> httpx.AsyncClient:
+        """Create an httpx client on the shared transport (MCP factory hook)."""
+        if timeout is None:
+            # Same defaults as the MCP library's own client factory
+            timeout = httpx.Timeout(30.0, read=300.0)
+        return httpx.AsyncClient(
+            transport=self._transport,
+            headers=headers,
+            timeout=timeout,
+            auth=auth,
+            follow_redirects=True,
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self._transport.aclose_pool()
+
 
 class MCPClient(ABC):
     """Abstract base class for MCP clients."""
 
-    def __init__(self, config: ServerConfig):
+    def __init__(self, config: ServerConfig, pool: Optional[HttpConnectionPool] = None):
         self.config = config
+        self.pool = pool
         self.session: Optional[ClientSession] = None
         self.client_context = None
 
@@ -65,18 +137,23 @@ class MCPClient(ABC):
 class SseMCPClient(MCPClient):
     """MCP client using SSE (Server-Sent Events) transport."""
 
-    def __init__(self, config: ServerConfig):
-        super().__init__(config)
+    def __init__(self, config: ServerConfig, pool: Optional[HttpConnectionPool] = None):
+        super().__init__(config, pool)
+        self._url = _http_url(config)
         self._sse_context: Any = None
         self._session_context: Any = None
 
     async def connect(self) -> None:
         """Connect to MCP server via SSE endpoint."""
-        url = self._build_url()
-        print(f"SSE URL: {url}")
+        logger.debug("SSE URL: %s", self._url)
 
         # Create the SSE context that will be used in the async with pattern
-        self._sse_context = sse_client(url, timeout=10.0)
+        if self.pool is not None:
+            self._sse_context = sse_client(
+                self._url, timeout=10.0, httpx_client_factory=self.pool.client_factory
+            )
+        else:
+            self._sse_context = sse_client(self._url, timeout=10.0)
 
     async def __aenter__(self) -> "SseMCPClient":
         """Enter the async context for proper SSE management."""
@@ -115,27 +192,31 @@ class SseMCPClient(MCPClient):
         # Context manager handles cleanup
         pass
 
-    def _build_url(self) -> str:
-        port_part = f":{self.config.port}" if self.config.port else ""
-        path_part = self.config.path or ""
-        return f"http://{self.config.host}{port_part}{path_part}"
-
 
 class StreamableHttpMCPClient(MCPClient):
     """MCP client using streamable HTTP transport."""
 
-    def __init__(self, config: ServerConfig):
-        super().__init__(config)
+    def __init__(self, config: ServerConfig, pool: Optional[HttpConnectionPool] = None):
+        super().__init__(config, pool)
+        self._url = _http_url(config)
         self._http_context: Any = None
         self._session_context: Any = None
 
     async def connect(self) -> None:
         """Connect to MCP server via streamable HTTP endpoint."""
-        url = self._build_url()
-        print(f"Streamable HTTP URL: {url}")
+        logger.debug("Streamable HTTP URL: %s", self._url)
 
         # Create the streamable HTTP context that will be used in the async with pattern
-        self._http_context = streamablehttp_client(url, timeout=timedelta(seconds=10.0))
+        if self.pool is not None:
+            self._http_context = streamablehttp_client(
+                self._url,
+                timeout=timedelta(seconds=10.0),
+                httpx_client_factory=self.pool.client_factory,
+            )
+        else:
+            self._http_context = streamablehttp_client(
+                self._url, timeout=timedelta(seconds=10.0)
+            )
 
     async def __aenter__(self) -> "StreamableHttpMCPClient":
         """Enter the async context for proper streamable HTTP management."""
@@ -174,18 +255,15 @@ class StreamableHttpMCPClient(MCPClient):
         # Context manager handles cleanup
         pass
 
-    def _build_url(self) -> str:
-        port_part = f":{self.config.port}" if self.config.port else ""
-        path_part = self.config.path or ""
-        return f"http://{self.config.host}{port_part}{path_part}"
-
 
-def create_client(config: ServerConfig) -> MCPClient:
+def create_client(
+    config: ServerConfig, pool: Optional[HttpConnectionPool] = None
+) -> MCPClient:
     """Factory function to create the appropriate client based on transport type."""
     if config.transport == "sse":
-        return SseMCPClient(config)
+        return SseMCPClient(config, pool)
     elif config.transport == "streamable_http":
-        return StreamableHttpMCPClient(config)
+        return StreamableHttpMCPClient(config, pool)
     else:
         raise ValueError(
             f"Unsupported transport type: {config.transport}. "
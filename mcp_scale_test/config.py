@@ -1,9 +1,19 @@
 """Configuration handling for MCP scale testing."""
 
+import json
+from functools import lru_cache
 from typing import Any, Dict, Literal, Optional
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Prefer the libyaml C bindings when PyYAML was built with them; the pure
+# Python loader/dumper is roughly an order of magnitude slower.
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
 
 TransportType = Literal["sse", "streamable_http"]
 
@@ -11,6 +21,8 @@ TransportType = Literal["sse", "streamable_http"]
 class ServerConfig(BaseModel):
     """MCP server connection configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     transport: TransportType
     host: str = "localhost"
     port: Optional[int] = None
@@ -20,11 +32,25 @@ class ServerConfig(BaseModel):
 class LoadTestConfig(BaseModel):
     """Load test configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     tool_name: str
     tool_args: Dict[str, Any] = Field(default_factory=dict)
     concurrent_requests: int = Field(ge=1, default=1)
     duration_seconds: int = Field(ge=1, default=60)
     shared_session: bool = Field(default=False)
+    # Per-worker request rate limit; None (the default) runs unthrottled so
+    # throughput is bounded only by server latency.
+    target_rps: Optional[float] = Field(gt=0, default=None)
+    # Maximum number of MCP connection handshakes in flight at once, so a
+    # large worker count does not storm the server with connects at t=0.
+    connect_concurrency: int = Field(ge=1, default=32)
+    # Tool calls kept outstanding per shared session; JSON-RPC ids allow
+    # overlapping requests, so values > 1 pipeline calls on one connection.
+    in_flight_per_worker: int = Field(ge=1, default=1)
+    # Keep only running aggregates instead of every latency sample; memory
+    # stays flat for arbitrarily long runs but percentiles are not reported.
+    summary_only: bool = Field(default=False)
 
 
 class Config(BaseModel):
@@ -35,14 +61,34 @@ class Config(BaseModel):
 
 
 def load_config(config_path: str) -> Config:
-    """Load configuration from YAML file."""
-    with open(config_path) as f:
-        data = yaml.safe_load(f)
+    """Load configuration from YAML file.
+
+    Configs are cached by file content, so repeated loads of an unchanged
+    file skip YAML parsing and model validation. Callers must treat the
+    returned Config as immutable.
+    """
+    with open(config_path, "rb") as f:
+        data = f.read()
 
-    return Config(**data)
+    return _parse_config(data)
+
+
+@lru_cache(maxsize=16)
+def _parse_config(data: bytes) -> Config:
+    """Parse config bytes, memoized on content."""
+    return Config(**yaml.load(data, Loader=SafeLoader))
 
 
 def save_results(results: Dict[str, Any], output_path: str) -> None:
-    """Save test results to YAML file."""
+    """Save test results to a YAML file, or JSON when the path ends in .json.
+
+    JSON serialization is much faster and more compact than YAML for the
+    large result payloads produced by long runs.
+    """
+    if output_path.endswith(".json"):
+        with open(output_path, "w") as f:
+            json.dump(results, f, separators=(",", ":"))
+        return
+
     with open(output_path, "w") as f:
-        yaml.dump(results, f, default_flow_style=False, indent=2)
+        yaml.dump(results, f, Dumper=SafeDumper, default_flow_style=False, indent=2)
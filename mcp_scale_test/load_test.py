@@ -2,15 +2,44 @@
 
 import asyncio
 import time
+from array import array
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
-from .client import MCPClient, create_client
+import numpy as np
+
+from ._stats_jit import summarize
+from .client import HttpConnectionPool, MCPClient, create_client
 from .config import Config
 from .variables import VariableExpander
 
+# Optional: with the hdrhistogram extra installed, summary_only mode can
+# still report percentiles from bounded-memory histogram buckets.
+try:
+    from hdrh.histogram import HdrHistogram
+
+    _HAS_HDR = True
+except ImportError:
+    _HAS_HDR = False
+
+# Bound on error-summary keys so a broken server emitting unique error
+# strings cannot grow the counter without limit.
+_MAX_ERROR_KEY_LENGTH = 80
+
 
-@dataclass
+def _error_key(e: BaseException) -> str:
+    """Error-summary key for a failed request.
+
+    Uses only the exception class name: stringifying the exception (and
+    its cause chain) on every failure is wasted allocation when the
+    summary collapses duplicates anyway, and embedding messages makes
+    the key cardinality unbounded for servers that echo request data.
+    """
+    return type(e).__name__
+
+
+@dataclass(slots=True)
 class LoadTestStats:
     """Statistics for a load test run."""
 
@@ -18,27 +47,60 @@ class LoadTestStats:
     requests_received: int = 0
     successes: int = 0
     failures: int = 0
-    response_times: List[float] = field(default_factory=list)
-    errors: List[str] = field(default_factory=list)
+    # int64 ns samples; 8 bytes each in contiguous memory instead of ~28
+    # bytes per boxed int in a list, and zero-copy viewable by numpy
+    response_times_ns: array = field(default_factory=lambda: array("q"))
+    errors: "Counter[str]" = field(default_factory=Counter)
     start_time: Optional[float] = None
     end_time: Optional[float] = None
     sessions_created: int = 0
-
-    def add_success(self, response_time: float) -> None:
+    # When True, only running aggregates are kept per response time (four
+    # integer ops per request) and no samples are retained; percentiles are
+    # unavailable in this mode
+    summary_only: bool = False
+    rt_count: int = 0
+    rt_sum_ns: int = 0
+    rt_sum_sq_ns: int = 0
+    rt_min_ns: int = 0
+    rt_max_ns: int = 0
+    histogram: Optional[Any] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.summary_only and _HAS_HDR:
+            # 1us to 60s range, 3 significant digits
+            self.histogram = HdrHistogram(1, 60_000_000, 3)
+
+    def add_success(self, response_time_ns: int) -> None:
         """Record a successful request."""
         self.requests_sent += 1
         self.requests_received += 1
         self.successes += 1
-        self.response_times.append(response_time)
+        self._record_response_time(response_time_ns)
 
-    def add_failure(self, error: str, response_time: Optional[float] = None) -> None:
+    def add_failure(self, error: str, response_time_ns: Optional[int] = None) -> None:
         """Record a failed request."""
         self.requests_sent += 1
         self.failures += 1
-        self.errors.append(error)
-        if response_time is not None:
+        self.errors[error[:_MAX_ERROR_KEY_LENGTH]] += 1
+        if response_time_ns is not None:
             self.requests_received += 1
-            self.response_times.append(response_time)
+            self._record_response_time(response_time_ns)
+
+    def _record_response_time(self, response_time_ns: int) -> None:
+        """Record one response time, as a sample or as running aggregates."""
+        if not self.summary_only:
+            self.response_times_ns.append(response_time_ns)
+            return
+
+        if self.rt_count == 0 or response_time_ns < self.rt_min_ns:
+            self.rt_min_ns = response_time_ns
+        if response_time_ns > self.rt_max_ns:
+            self.rt_max_ns = response_time_ns
+        self.rt_count += 1
+        self.rt_sum_ns += response_time_ns
+        self.rt_sum_sq_ns += response_time_ns * response_time_ns
+        if self.histogram is not None:
+            self.histogram.record_value(max(response_time_ns // 1000, 1))
 
     def add_session_created(self) -> None:
         """Record that a new MCP session was created."""
@@ -63,25 +125,10 @@ class LoadTestStats:
                 "end_time": self.end_time,
             }
 
-        if self.response_times:
-            response_times_dict: Dict[str, float] = {
-                "min_ms": min(self.response_times) * 1000,
-                "max_ms": max(self.response_times) * 1000,
-                "avg_ms": sum(self.response_times) / len(self.response_times) * 1000,
-            }
-        else:
-            response_times_dict = {
-                "min_ms": 0.0,
-                "max_ms": 0.0,
-                "avg_ms": 0.0,
-            }
-        result["response_times"] = response_times_dict
+        result["response_times"] = self._response_times_dict()
 
         if self.errors:
-            error_summary: Dict[str, int] = {}
-            for error in self.errors:
-                error_summary[error] = error_summary.get(error, 0) + 1
-            result["error_summary"] = error_summary
+            result["error_summary"] = dict(self.errors)
 
         # Add throughput metrics if we have execution time
         if (
@@ -100,6 +147,75 @@ class LoadTestStats:
 
         return result
 
+    def _response_times_dict(self) -> Dict[str, float]:
+        """Summarize response times for to_dict."""
+        if self.summary_only:
+            if self.rt_count:
+                mean_ns = self.rt_sum_ns / self.rt_count
+                variance = self.rt_sum_sq_ns / self.rt_count - mean_ns * mean_ns
+                summary = {
+                    "min_ms": self.rt_min_ns / 1e6,
+                    "max_ms": self.rt_max_ns / 1e6,
+                    "avg_ms": mean_ns / 1e6,
+                    "stddev_ms": max(variance, 0.0) ** 0.5 / 1e6,
+                }
+                if self.histogram is not None:
+                    # Histogram values are in microseconds
+                    for key, pct in (
+                        ("p50_ms", 50),
+                        ("p95_ms", 95),
+                        ("p99_ms", 99),
+                        ("p999_ms", 99.9),
+                    ):
+                        summary[key] = (
+                            self.histogram.get_value_at_percentile(pct) / 1000
+                        )
+                return summary
+            return {"min_ms": 0.0, "max_ms": 0.0, "avg_ms": 0.0, "stddev_ms": 0.0}
+
+        arr = np.frombuffer(self.response_times_ns, dtype=np.int64)
+        if arr.size:
+            min_ns, max_ns, mean_ns, std_ns = summarize(arr)
+            p50, p95, p99 = np.percentile(arr, [50, 95, 99])
+            return {
+                "min_ms": min_ns / 1e6,
+                "max_ms": max_ns / 1e6,
+                "avg_ms": mean_ns / 1e6,
+                "stddev_ms": std_ns / 1e6,
+                "p50_ms": float(p50) / 1e6,
+                "p95_ms": float(p95) / 1e6,
+                "p99_ms": float(p99) / 1e6,
+            }
+        return {
+            "min_ms": 0.0,
+            "max_ms": 0.0,
+            "avg_ms": 0.0,
+            "stddev_ms": 0.0,
+            "p50_ms": 0.0,
+            "p95_ms": 0.0,
+            "p99_ms": 0.0,
+        }
+
+    def merge(self, other: "LoadTestStats") -> None:
+        """Fold another stats object (e.g. from a worker) into this one."""
+        self.requests_sent += other.requests_sent
+        self.requests_received += other.requests_received
+        self.successes += other.successes
+        self.failures += other.failures
+        self.sessions_created += other.sessions_created
+        self.response_times_ns.extend(other.response_times_ns)
+        self.errors.update(other.errors)
+        if other.rt_count:
+            if self.rt_count == 0 or other.rt_min_ns < self.rt_min_ns:
+                self.rt_min_ns = other.rt_min_ns
+            if other.rt_max_ns > self.rt_max_ns:
+                self.rt_max_ns = other.rt_max_ns
+            self.rt_count += other.rt_count
+            self.rt_sum_ns += other.rt_sum_ns
+            self.rt_sum_sq_ns += other.rt_sum_sq_ns
+        if self.histogram is not None and other.histogram is not None:
+            self.histogram.add(other.histogram)
+
     @property
     def execution_time_seconds(self) -> float:
         """Get execution time in seconds."""
@@ -113,9 +229,33 @@ class LoadTester:
 
     def __init__(self, config: Config):
         self.config = config
-        self.stats = LoadTestStats()
-        self._stop_event = asyncio.Event()
+        self.stats = LoadTestStats(summary_only=config.test.summary_only)
+        # Monotonic stop deadline, set by run_test; workers compare against
+        # it directly instead of polling an asyncio.Event
+        self._deadline_ns = 0
         self._variable_expander = VariableExpander()
+        self._connect_semaphore = asyncio.Semaphore(config.test.connect_concurrency)
+        # One TCP pool shared by the long-lived sessions in shared-session
+        # mode. Per-request mode must not use it: the pool's transport
+        # ignores per-client aclose(), so each short-lived session would
+        # leak its still-open streams into the pool until max_connections
+        # is exhausted and further connects block. Each worker holds one
+        # standing SSE/GET stream plus up to in_flight_per_worker POSTs,
+        # so the cap scales with both to keep pipelining unthrottled.
+        self._http_pool: Optional[HttpConnectionPool] = (
+            HttpConnectionPool(
+                max_connections=config.test.concurrent_requests
+                * (config.test.in_flight_per_worker + 1)
+            )
+            if config.test.shared_session
+            else None
+        )
+        # Loop-invariant for the whole run; bound here so the per-request
+        # path doesn't traverse the config attribute chain every iteration
+        self._tool_name = config.test.tool_name
+        # Compiled once: rendering only executes the dynamic variables
+        # instead of re-walking tool_args and regex-matching every string
+        self._args_plan = self._variable_expander.compile(config.test.tool_args)
 
     async def run_test(self) -> Dict[str, Any]:
         """Run the load test and return results."""
@@ -127,8 +267,10 @@ class LoadTester:
         # Record start time
         self.stats.start_time = time.time()
 
-        # Start the timer
-        asyncio.create_task(self._timer())
+        # Workers stop once the monotonic clock passes this deadline
+        self._deadline_ns = (
+            time.monotonic_ns() + self.config.test.duration_seconds * 1_000_000_000
+        )
 
         session_mode = (
             "shared session per worker"
@@ -143,8 +285,15 @@ class LoadTester:
             task = asyncio.create_task(self._worker(f"worker-{i}"))
             tasks.append(task)
 
-        # Wait for all workers to complete
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Wait for all workers to complete and fold their stats together;
+        # workers catch their own exceptions and always return their stats
+        try:
+            per_worker = await asyncio.gather(*tasks)
+        finally:
+            if self._http_pool is not None:
+                await self._http_pool.aclose()
+        for worker_stats in per_worker:
+            self.stats.merge(worker_stats)
 
         # Record end time
         self.stats.end_time = time.time()
@@ -170,114 +319,204 @@ class LoadTester:
 
         return self.stats.to_dict()
 
-    async def _timer(self) -> None:
-        """Timer to stop the test after the specified duration."""
-        await asyncio.sleep(self.config.test.duration_seconds)
-        self._stop_event.set()
+    async def _worker(self, worker_id: str) -> LoadTestStats:
+        """Worker coroutine that sends requests until stopped.
 
-    async def _worker(self, worker_id: str) -> None:
-        """Worker coroutine that sends requests until stopped."""
+        Each worker records into its own LoadTestStats so the hot path never
+        touches shared state; run_test merges the results after gather.
+        """
+        stats = LoadTestStats(summary_only=self.config.test.summary_only)
         try:
             if self.config.test.shared_session:
-                # Create one client connection for this worker and reuse it
-                client = create_client(self.config.server)
-                await client.connect()
-                self.stats.add_session_created()  # Track session creation
-
-                # Use the client as an async context manager
-                async with client:
-                    await self._run_worker_loop_with_shared_session(client, worker_id)
+                # Stagger connection handshakes so all workers don't storm
+                # the server at t=0; released once the session is established.
+                await self._connect_semaphore.acquire()
+                connected = False
+                try:
+                    # Create one client connection for this worker and reuse it
+                    client = create_client(self.config.server, self._http_pool)
+                    await client.connect()
+                    stats.add_session_created()  # Track session creation
+
+                    # Use the client as an async context manager
+                    async with client:
+                        self._connect_semaphore.release()
+                        connected = True
+                        await self._run_worker_loop_with_shared_session(
+                            client, worker_id, stats
+                        )
+                finally:
+                    if not connected:
+                        self._connect_semaphore.release()
             else:
                 # Create new connection for each request
-                await self._run_worker_loop_without_shared_session(worker_id)
+                await self._run_worker_loop_without_shared_session(worker_id, stats)
 
         except asyncio.TimeoutError:
-            self.stats.add_failure(f"Worker {worker_id} connection timeout")
+            stats.add_failure(f"Worker {worker_id} connection timeout")
         except Exception as e:
-            self.stats.add_failure(f"Worker {worker_id} error: {str(e)}")
+            stats.add_failure(f"Worker {worker_id} error: {str(e)}")
+
+        return stats
 
     async def _run_worker_loop_with_shared_session(
-        self, client: MCPClient, worker_id: str
+        self, client: MCPClient, worker_id: str, stats: LoadTestStats
     ) -> None:
         """Run worker loop with shared session - reuse same client connection."""
-        # Keep sending requests until stopped
-        while not self._stop_event.is_set():
-            await self._send_request_with_client(client, worker_id)
-
-            # Small delay to prevent overwhelming the server
-            await asyncio.sleep(0.01)
+        in_flight = self.config.test.in_flight_per_worker
+        if in_flight > 1:
+            await self._run_worker_loop_pipelined(client, worker_id, stats, in_flight)
+            return
+
+        # Bind hot-loop lookups to locals: the loop can run >10k iterations/s
+        # and each bound name saves attribute traversals per iteration
+        deadline_ns = self._deadline_ns
+        mono_ns = time.monotonic_ns
+        send = self._send_request_with_client
+        sleep = asyncio.sleep
+
+        target_rps = self.config.test.target_rps
+        if target_rps is None:
+            # Unthrottled hot path: the send logic is inlined so each
+            # iteration avoids one coroutine allocation and frame setup;
+            # _send_request_with_client stays the canonical single-request
+            # implementation for the pipelined and paced paths
+            render_args = self._args_plan.render
+            call = client.call_tool
+            tool = self._tool_name
+            add_success = stats.add_success
+            add_failure = stats.add_failure
+            perf_ns = time.perf_counter_ns
+            while mono_ns() < deadline_ns:
+                start = perf_ns()
+                try:
+                    await call(tool, render_args())
+                    add_success(perf_ns() - start)
+                except asyncio.CancelledError:
+                    # Worker was cancelled, this is expected during shutdown
+                    pass
+                except Exception as e:
+                    add_failure(_error_key(e), perf_ns() - start)
+        else:
+            loop_time = asyncio.get_running_loop().time
+            next_send = loop_time()
+            while mono_ns() < deadline_ns:
+                await send(client, worker_id, stats)
+                next_send += 1 / target_rps
+                delay = next_send - loop_time()
+                if delay > 0:
+                    await sleep(delay)
+
+    async def _run_worker_loop_pipelined(
+        self, client: MCPClient, worker_id: str, stats: LoadTestStats, in_flight: int
+    ) -> None:
+        """Keep up to in_flight tool calls outstanding on one shared session.
+
+        A single MCP session multiplexes concurrent JSON-RPC requests by id,
+        so the worker is not idle for a full round trip between calls.
+        """
+        deadline_ns = self._deadline_ns
+        mono_ns = time.monotonic_ns
+        pending: set = set()
+        try:
+            while mono_ns() < deadline_ns:
+                while len(pending) < in_flight and mono_ns() < deadline_ns:
+                    pending.add(
+                        asyncio.create_task(
+                            self._send_request_with_client(client, worker_id, stats)
+                        )
+                    )
+                _, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            # Drain in-flight requests on shutdown so stats stay consistent
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
-    async def _run_worker_loop_without_shared_session(self, worker_id: str) -> None:
+    async def _run_worker_loop_without_shared_session(
+        self, worker_id: str, stats: LoadTestStats
+    ) -> None:
         """Run worker loop without shared session - new connection per request."""
-        # Keep sending requests until stopped
-        while not self._stop_event.is_set():
-            await self._send_request_with_new_connection(worker_id)
-
-            # Small delay to prevent overwhelming the server
-            await asyncio.sleep(0.01)
+        # Bind hot-loop lookups to locals, as in the shared-session loop
+        deadline_ns = self._deadline_ns
+        mono_ns = time.monotonic_ns
+        send = self._send_request_with_new_connection
+        sleep = asyncio.sleep
+
+        target_rps = self.config.test.target_rps
+        if target_rps is None:
+            # Unthrottled; each send awaits network I/O, which already
+            # yields to the event loop
+            while mono_ns() < deadline_ns:
+                await send(worker_id, stats)
+        else:
+            loop_time = asyncio.get_running_loop().time
+            next_send = loop_time()
+            while mono_ns() < deadline_ns:
+                await send(worker_id, stats)
+                next_send += 1 / target_rps
+                delay = next_send - loop_time()
+                if delay > 0:
+                    await sleep(delay)
 
     async def _send_request_with_client(
-        self, client: MCPClient, _worker_id: str
+        self, client: MCPClient, _worker_id: str, stats: LoadTestStats
     ) -> None:
         """Send a single request using provided client connection."""
-        start_time = time.time()
+        perf_counter_ns = time.perf_counter_ns
+        start = perf_counter_ns()
 
         try:
             # Expand variables in tool arguments for each request
-            expanded_args = self._variable_expander.expand_arguments(
-                self.config.test.tool_args
-            )
+            expanded_args = self._args_plan.render()
 
-            await client.call_tool(self.config.test.tool_name, expanded_args)
+            await client.call_tool(self._tool_name, expanded_args)
 
-            end_time = time.time()
-            response_time = end_time - start_time
+            elapsed_ns = perf_counter_ns() - start
 
             # MCP client raises exceptions for errors, success if we get here
-            self.stats.add_success(response_time)
+            stats.add_success(elapsed_ns)
 
         except asyncio.CancelledError:
             # Worker was cancelled, this is expected during shutdown
             pass
 
         except Exception as e:
-            end_time = time.time()
-            response_time = end_time - start_time
-            self.stats.add_failure(f"Request error: {str(e)}", response_time)
+            elapsed_ns = perf_counter_ns() - start
+            stats.add_failure(_error_key(e), elapsed_ns)
 
-    async def _send_request_with_new_connection(self, _worker_id: str) -> None:
+    async def _send_request_with_new_connection(
+        self, _worker_id: str, stats: LoadTestStats
+    ) -> None:
         """Send a single request creating a new connection each time."""
-        start_time = time.time()
+        start = time.perf_counter_ns()
 
         try:
             # Create new client for this single request
-            client = create_client(self.config.server)
+            client = create_client(self.config.server, self._http_pool)
             await client.connect()
-            self.stats.add_session_created()  # Track session creation
+            stats.add_session_created()  # Track session creation
 
             # Use the client as an async context manager
             async with client:
                 # Expand variables in tool arguments for each request
-                expanded_args = self._variable_expander.expand_arguments(
-                    self.config.test.tool_args
-                )
+                expanded_args = self._args_plan.render()
 
-                await client.call_tool(self.config.test.tool_name, expanded_args)
+                await client.call_tool(self._tool_name, expanded_args)
 
-            end_time = time.time()
-            response_time = end_time - start_time
+            elapsed_ns = time.perf_counter_ns() - start
 
             # MCP client raises exceptions for errors, success if we get here
-            self.stats.add_success(response_time)
+            stats.add_success(elapsed_ns)
 
         except asyncio.CancelledError:
             # Worker was cancelled, this is expected during shutdown
             pass
 
         except Exception as e:
-            end_time = time.time()
-            response_time = end_time - start_time
-            self.stats.add_failure(f"Request error: {str(e)}", response_time)
+            elapsed_ns = time.perf_counter_ns() - start
+            stats.add_failure(_error_key(e), elapsed_ns)
 
 
 async def run_load_test(config: Config) -> Dict[str, Any]:
@@ -2,7 +2,28 @@
 
 import re
 import time
-from typing import Any, Dict
+from random import randint
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+
+class ArgumentPlan:
+    """Pre-compiled expansion plan for a fixed tool_args structure.
+
+    expand_arguments re-walks the whole structure and regex-matches every
+    string on each call; for a schema that never changes during a run that
+    is pure repeated work. A plan analyses the structure once and render()
+    only executes the dynamic parts (counter, timestamp, randint).
+
+    Static subtrees are returned by reference, so callers must not mutate
+    rendered results.
+    """
+
+    def __init__(self, render: Callable[[], Dict[str, Any]]):
+        self._render = render
+
+    def render(self) -> Dict[str, Any]:
+        """Produce the expanded arguments for one request."""
+        return self._render()
 
 
 class VariableExpander:
@@ -11,7 +32,7 @@ class VariableExpander:
     def __init__(self) -> None:
         self._counter = 0
         # Pattern to match {{variable}} or {{function(args)}}
-        self._pattern = re.compile(r"\{\{([^}]+)\}\}")
+        self._pattern = re.compile(r"\{\{([^}]+)\}\}", re.ASCII)
 
     def expand_arguments(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -31,21 +52,168 @@ class VariableExpander:
         # Type checker doesn't know _expand_recursive preserves dict structure
         return result  # type: ignore[no-any-return]
 
-    def _expand_recursive(self, obj: Any) -> Any:
-        """Recursively expand variables in nested data structures."""
+    def compile(self, args: Dict[str, Any]) -> ArgumentPlan:
+        """
+        Compile an arguments dictionary into a reusable expansion plan.
+
+        Args:
+            args: Dictionary containing potential template variables
+
+        Returns:
+            ArgumentPlan whose render() expands the variables without
+            re-walking the structure or re-matching any regex
+        """
+        if not args:
+            return ArgumentPlan(dict)
+
+        static, value = self._compile_node(args)
+        if static:
+            return ArgumentPlan(lambda: value)
+        return ArgumentPlan(value)
+
+    def _compile_node(self, obj: Any) -> Tuple[bool, Any]:
+        """
+        Compile one node of the structure.
+
+        Returns:
+            (True, value) for static subtrees, reused as-is at render time,
+            or (False, thunk) where thunk() produces the node's value
+        """
         if isinstance(obj, dict):
-            return {key: self._expand_recursive(value) for key, value in obj.items()}
+            compiled = {key: self._compile_node(value) for key, value in obj.items()}
+            if all(static for static, _ in compiled.values()):
+                return True, obj
+
+            def render_dict() -> Dict[str, Any]:
+                return {
+                    key: value if static else value()
+                    for key, (static, value) in compiled.items()
+                }
+
+            return False, render_dict
         elif isinstance(obj, list):
-            return [self._expand_recursive(item) for item in obj]
+            compiled_items = [self._compile_node(item) for item in obj]
+            if all(static for static, _ in compiled_items):
+                return True, obj
+
+            def render_list() -> List[Any]:
+                return [
+                    value if static else value() for static, value in compiled_items
+                ]
+
+            return False, render_list
         elif isinstance(obj, str):
-            return self._expand_string(obj)
+            return self._compile_string(obj)
+        else:
+            return True, obj
+
+    def _compile_string(self, text: str) -> Tuple[bool, Any]:
+        """Compile a string template into a static value or a thunk."""
+        if "{{" not in text:
+            return True, text
+
+        # Whole string is a single variable: preserve the resolved type
+        full_match = self._pattern.fullmatch(text)
+        if full_match:
+            return self._compile_variable(full_match.group(1))
+
+        # Mixed template: split into literal and variable parts once
+        parts: List[Union[str, Callable[[], Any]]] = []
+        last = 0
+        for match in self._pattern.finditer(text):
+            if match.start() > last:
+                parts.append(text[last : match.start()])
+            static, value = self._compile_variable(match.group(1))
+            parts.append(str(value) if static else value)
+            last = match.end()
+        if last < len(text):
+            parts.append(text[last:])
+
+        def render_string() -> str:
+            return "".join(
+                part if isinstance(part, str) else str(part()) for part in parts
+            )
+
+        return False, render_string
+
+    def _compile_variable(self, variable: str) -> Tuple[bool, Any]:
+        """Compile a single variable reference."""
+        variable = variable.strip()
+
+        if variable == "timestamp":
+            return False, time.time
+        elif variable == "counter":
+
+            def next_counter() -> int:
+                self._counter += 1
+                return self._counter
+
+            return False, next_counter
+        elif variable.startswith("random.randint("):
+            # Parse the bounds once; render only draws the random number
+            match = re.match(r"random\.randint\((\d+),(\d+)\)", variable)
+            if not match:
+                raise ValueError(f"Invalid randint expression: {variable}")
+            min_val = int(match.group(1))
+            max_val = int(match.group(2))
+            return False, lambda: randint(min_val, max_val)
+        else:
+            # Unknown variable, same placeholder as _resolve_variable
+            return True, f"{{{{unknown:{variable}}}}}"
+
+    def _expand_recursive(self, obj: Any) -> Any:
+        """Expand variables in nested data structures.
+
+        Walks the structure with an explicit work stack rather than the
+        call stack, and only hands strings that actually contain "{{" to
+        _expand_string, so plain values pay no per-leaf function call.
+        """
+        if isinstance(obj, str):
+            return self._expand_string(obj) if "{{" in obj else obj
+        if isinstance(obj, dict):
+            root: Any = {}
+        elif isinstance(obj, list):
+            root = [None] * len(obj)
         else:
             return obj
 
+        def _entries(source: Any) -> Any:
+            return (
+                iter(source.items()) if isinstance(source, dict) else enumerate(source)
+            )
+
+        # Each stack frame suspends a container's item iterator, so values
+        # are expanded in the same depth-first order as the old recursion
+        stack = [(_entries(obj), root)]
+        while stack:
+            items, out = stack[-1]
+            for key, value in items:
+                if isinstance(value, str):
+                    out[key] = self._expand_string(value) if "{{" in value else value
+                elif isinstance(value, dict):
+                    child: Any = {}
+                    out[key] = child
+                    stack.append((_entries(value), child))
+                    break
+                elif isinstance(value, list):
+                    child = [None] * len(value)
+                    out[key] = child
+                    stack.append((_entries(value), child))
+                    break
+                else:
+                    out[key] = value
+            else:
+                stack.pop()
+        return root
+
     def _expand_string(self, text: str) -> Any:
         """
         Expand variables in a string.
 
+        Uses a linear scan over the string instead of regex matching; for
+        the short templates typical of tool_args the scan is several times
+        cheaper than the regex machinery.
+
         Args:
             text: String that may contain {{variable}} patterns
 
@@ -53,17 +221,38 @@ class VariableExpander:
             String with variables replaced, or the actual value if the entire
             string is a single variable
         """
+        start = text.find("{{")
+        if start == -1:
+            return text
+
         # Check if the entire string is a single variable (for type preservation)
-        full_match = re.fullmatch(r"\{\{([^}]+)\}\}", text)
-        if full_match:
-            return self._resolve_variable(full_match.group(1))
+        if start == 0 and text.endswith("}}"):
+            inner = text[2:-2]
+            if inner and "}" not in inner:
+                return self._resolve_variable(inner)
 
         # Replace all variables in the string
-        def replace_var(match: re.Match[str]) -> str:
-            value = self._resolve_variable(match.group(1))
-            return str(value)
-
-        return self._pattern.sub(replace_var, text)
+        parts = []
+        i = 0
+        while True:
+            start = text.find("{{", i)
+            if start == -1:
+                parts.append(text[i:])
+                break
+            end = text.find("}}", start + 2)
+            if end == -1:
+                parts.append(text[i:])
+                break
+            inner = text[start + 2 : end]
+            if not inner or "}" in inner:
+                # No valid variable opens at this brace pair; keep scanning
+                parts.append(text[i : start + 1])
+                i = start + 1
+                continue
+            parts.append(text[i:start])
+            parts.append(str(self._resolve_variable(inner)))
+            i = end + 2
+        return "".join(parts)
 
     def _resolve_variable(self, variable: str) -> Any:
         """
@@ -99,17 +288,13 @@ class VariableExpander:
         Returns:
             Random integer in the specified range
         """
-        import random
-
         # Extract the arguments from random.randint(min,max)
-        match = re.match(r"random\.randint\((\d+),(\d+)\)", expr)
-        if not match:
-            raise ValueError(f"Invalid randint expression: {expr}")
-
-        min_val = int(match.group(1))
-        max_val = int(match.group(2))
+        if expr.startswith("random.randint(") and expr.endswith(")"):
+            bounds = expr[len("random.randint(") : -1].split(",")
+            if len(bounds) == 2 and bounds[0].isdigit() and bounds[1].isdigit():
+                return randint(int(bounds[0]), int(bounds[1]))
 
-        return random.randint(min_val, max_val)
+        raise ValueError(f"Invalid randint expression: {expr}")
 
     def reset_counter(self) -> None:
         """Reset the counter to 0."""
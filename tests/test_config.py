@@ -1,8 +1,17 @@
 """Tests for configuration handling."""
 
+import json
+from pathlib import Path
+
 import pytest
 
-from mcp_scale_test.config import Config, LoadTestConfig, ServerConfig
+from mcp_scale_test.config import (
+    Config,
+    LoadTestConfig,
+    ServerConfig,
+    load_config,
+    save_results,
+)
 
 
 def test_server_config_validation() -> None:
@@ -66,7 +75,52 @@ def test_shared_session_config() -> None:
     assert config.shared_session is True
 
 
+def test_target_rps_config() -> None:
+    """Test target RPS configuration."""
+    config = LoadTestConfig(tool_name="echo", duration_seconds=1)
+    assert config.target_rps is None  # Unthrottled by default
+
+    config = LoadTestConfig(tool_name="echo", duration_seconds=1, target_rps=50.0)
+    assert config.target_rps == 50.0
+
+    with pytest.raises(ValueError):
+        LoadTestConfig(tool_name="echo", duration_seconds=1, target_rps=0)
+
+
 def test_invalid_concurrent_requests() -> None:
     """Test invalid concurrent requests."""
     with pytest.raises(ValueError):
         LoadTestConfig(tool_name="test", concurrent_requests=0, duration_seconds=1)
+
+
+def test_load_config_caches_by_content(tmp_path: Path) -> None:
+    """Test that load_config reuses the parsed config for unchanged content."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "server:\n"
+        "  transport: sse\n"
+        "  host: localhost\n"
+        "  port: 8080\n"
+        "test:\n"
+        "  tool_name: echo\n"
+        "  duration_seconds: 1\n"
+    )
+
+    first = load_config(str(config_file))
+    second = load_config(str(config_file))
+    assert first is second  # Same content hits the cache
+
+    config_file.write_text(config_file.read_text().replace("8080", "9090"))
+    changed = load_config(str(config_file))
+    assert changed is not first
+    assert changed.server.port == 9090
+
+
+def test_save_results_json(tmp_path: Path) -> None:
+    """Test saving results as JSON based on the file extension."""
+    results = {"successes": 3, "failures": 1}
+    output_file = tmp_path / "results.json"
+
+    save_results(results, str(output_file))
+
+    assert json.loads(output_file.read_text()) == results
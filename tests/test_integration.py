@@ -0,0 +1,85 @@
+"""Integration tests against a local MCP server."""
+
+import socket
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+import uvicorn
+from mcp.server.fastmcp import FastMCP
+
+from mcp_scale_test.config import Config, LoadTestConfig, ServerConfig
+from mcp_scale_test.load_test import LoadTester
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+@pytest.fixture
+def mcp_server_port() -> Iterator[int]:
+    """Run a streamable HTTP MCP server with an echo tool in a thread."""
+    mcp = FastMCP("test-server")
+
+    @mcp.tool()
+    def echo(message: str) -> str:
+        return message
+
+    port = _free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(
+            mcp.streamable_http_app(),
+            host="127.0.0.1",
+            port=port,
+            log_level="error",
+        )
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError("Test MCP server failed to start")
+        time.sleep(0.05)
+
+    yield port
+
+    server.should_exit = True
+    thread.join(timeout=5)
+
+
+async def test_per_request_mode_short_run(mcp_server_port: int) -> None:
+    """Per-request mode must complete on time with every connect accounted for.
+
+    Regression test for the shared HTTP pool: when per-request sessions were
+    routed through it, closed sessions leaked connections into the pool until
+    new connects blocked and runs overshot their deadline.
+    """
+    config = Config(
+        server=ServerConfig(
+            transport="streamable_http",
+            host="127.0.0.1",
+            port=mcp_server_port,
+            path="/mcp",
+        ),
+        test=LoadTestConfig(
+            tool_name="echo",
+            tool_args={"message": "hello {{counter}}"},
+            concurrent_requests=2,
+            duration_seconds=2,
+            shared_session=False,
+        ),
+    )
+
+    tester = LoadTester(config)
+    start = time.monotonic()
+    results = await tester.run_test()
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 10  # Run must not overshoot its 2s deadline by much
+    assert results["successes"] > 0
+    assert results["failures"] == 0
+    assert results["sessions_created"] == results["successes"]
@@ -1,5 +1,7 @@
 """Tests for load testing functionality."""
 
+from collections import Counter
+
 from mcp_scale_test.load_test import LoadTestStats
 
 
@@ -11,8 +13,8 @@ def test_test_stats_initialization() -> None:
     assert stats.requests_received == 0
     assert stats.successes == 0
     assert stats.failures == 0
-    assert stats.response_times == []
-    assert stats.errors == []
+    assert list(stats.response_times_ns) == []
+    assert stats.errors == Counter()
     assert stats.start_time is None
     assert stats.end_time is None
     assert stats.sessions_created == 0
@@ -22,37 +24,37 @@ def test_test_stats_add_success() -> None:
     """Test adding successful requests."""
     stats = LoadTestStats()
 
-    stats.add_success(0.1)
-    stats.add_success(0.2)
+    stats.add_success(100_000_000)
+    stats.add_success(200_000_000)
 
     assert stats.requests_sent == 2
     assert stats.requests_received == 2
     assert stats.successes == 2
     assert stats.failures == 0
-    assert stats.response_times == [0.1, 0.2]
+    assert list(stats.response_times_ns) == [100_000_000, 200_000_000]
 
 
 def test_test_stats_add_failure() -> None:
     """Test adding failed requests."""
     stats = LoadTestStats()
 
-    stats.add_failure("Connection error", 0.05)
+    stats.add_failure("Connection error", 50_000_000)
     stats.add_failure("Timeout")
 
     assert stats.requests_sent == 2
     assert stats.requests_received == 1  # Only first failure had response time
     assert stats.successes == 0
     assert stats.failures == 2
-    assert stats.response_times == [0.05]
-    assert stats.errors == ["Connection error", "Timeout"]
+    assert list(stats.response_times_ns) == [50_000_000]
+    assert stats.errors == Counter({"Connection error": 1, "Timeout": 1})
 
 
 def test_test_stats_to_dict() -> None:
     """Test converting stats to dictionary."""
     stats = LoadTestStats()
-    stats.add_success(0.1)
-    stats.add_success(0.3)
-    stats.add_failure("Error", 0.2)
+    stats.add_success(100_000_000)
+    stats.add_success(300_000_000)
+    stats.add_failure("Error", 200_000_000)
 
     result = stats.to_dict()
 
@@ -63,6 +65,10 @@ def test_test_stats_to_dict() -> None:
     assert result["response_times"]["min_ms"] == 100.0
     assert result["response_times"]["max_ms"] == 300.0
     assert abs(result["response_times"]["avg_ms"] - 200.0) < 0.001
+    assert result["response_times"]["p50_ms"] == 200.0
+    assert result["response_times"]["p99_ms"] <= 300.0
+    # Population stddev of 100/200/300 ms
+    assert abs(result["response_times"]["stddev_ms"] - 81.6497) < 0.001
     assert result["error_summary"]["Error"] == 1
 
 
@@ -76,6 +82,7 @@ def test_test_stats_to_dict_empty() -> None:
     assert result["response_times"]["min_ms"] == 0.0
     assert result["response_times"]["max_ms"] == 0.0
     assert result["response_times"]["avg_ms"] == 0.0
+    assert result["response_times"]["p99_ms"] == 0.0
     # No execution time info without start/end times
     assert "execution_time" not in result
     assert "throughput" not in result
@@ -86,8 +93,8 @@ def test_test_stats_execution_time() -> None:
     stats = LoadTestStats()
     stats.start_time = 1000.0
     stats.end_time = 1005.5
-    stats.add_success(0.1)
-    stats.add_success(0.2)
+    stats.add_success(100_000_000)
+    stats.add_success(200_000_000)
 
     result = stats.to_dict()
 
@@ -115,3 +122,38 @@ def test_session_tracking() -> None:
 
     result = stats.to_dict()
     assert result["sessions_created"] == 3
+
+
+def test_summary_only_stats() -> None:
+    """Test summary-only mode keeps aggregates without retaining samples."""
+    stats = LoadTestStats(summary_only=True)
+    stats.add_success(100_000_000)
+    stats.add_success(300_000_000)
+    stats.add_failure("Error", 200_000_000)
+
+    assert list(stats.response_times_ns) == []  # No samples retained
+    assert stats.rt_count == 3
+
+    result = stats.to_dict()
+    assert result["response_times"]["min_ms"] == 100.0
+    assert result["response_times"]["max_ms"] == 300.0
+    assert abs(result["response_times"]["avg_ms"] - 200.0) < 0.001
+    if stats.histogram is None:
+        # Percentiles need full samples or the optional hdrhistogram extra
+        assert "p99_ms" not in result["response_times"]
+    else:
+        assert 290 < result["response_times"]["p99_ms"] < 310
+
+
+def test_summary_only_merge() -> None:
+    """Test merging summary-only worker stats."""
+    total = LoadTestStats(summary_only=True)
+    worker = LoadTestStats(summary_only=True)
+    worker.add_success(100_000_000)
+    worker.add_success(300_000_000)
+
+    total.merge(worker)
+
+    assert total.rt_count == 2
+    assert total.rt_min_ns == 100_000_000
+    assert total.rt_max_ns == 300_000_000
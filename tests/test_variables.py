@@ -231,3 +231,63 @@ def test_complex_example() -> None:
     assert 1 <= result["metadata"]["config"]["retries"] <= 3
     assert re.match(r"category_[1-5]", result["filters"][0])
     assert re.match(r"priority_[1-9]|priority_10", result["filters"][1])
+
+
+def test_compiled_plan_static_args() -> None:
+    """Test that a plan for static arguments reuses the structure."""
+    expander = VariableExpander()
+
+    args = {"message": "hello", "nested": {"key": "value"}, "count": 42}
+    plan = expander.compile(args)
+
+    assert plan.render() == args
+    assert plan.render() is plan.render()  # Static plans share the structure
+
+
+def test_compiled_plan_dynamic_args() -> None:
+    """Test that a compiled plan re-executes dynamic variables per render."""
+    expander = VariableExpander()
+
+    plan = expander.compile(
+        {
+            "count": "{{counter}}",
+            "num": "{{random.randint(1,10)}}",
+            "label": "request {{counter}}",
+            "static": "unchanged",
+        }
+    )
+
+    first = plan.render()
+    second = plan.render()
+
+    assert first["count"] == 1
+    assert first["label"] == "request 2"
+    assert second["count"] == 3
+    assert 1 <= first["num"] <= 10
+    assert first["static"] == "unchanged"
+
+
+def test_compiled_plan_matches_expand_arguments() -> None:
+    """Test that rendering matches expand_arguments for nested structures."""
+    args = {
+        "user": {"id": "{{counter}}", "time": "{{timestamp}}"},
+        "tags": ["static", "n-{{random.randint(5,5)}}"],
+    }
+
+    expanded = VariableExpander().expand_arguments(args)
+    rendered = VariableExpander().compile(args).render()
+
+    assert rendered["user"]["id"] == expanded["user"]["id"]
+    assert isinstance(rendered["user"]["time"], float)
+    assert rendered["tags"] == ["static", "n-5"]
+
+
+def test_compiled_plan_invalid_randint() -> None:
+    """Test that compiling an invalid randint expression fails eagerly."""
+    expander = VariableExpander()
+
+    try:
+        expander.compile({"bad": "{{random.randint(invalid)}}"})
+        raise AssertionError("Should have raised ValueError")
+    except ValueError as e:
+        assert "Invalid randint expression" in str(e)